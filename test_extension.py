@@ -2,258 +2,401 @@
 """
 Comprehensive test suite for DevBoost Pro VS Code Extension
 Validates all components for production readiness
+
+Run in parallel with: pytest -n auto --dist loadgroup test_extension.py
+From an existing interpreter, call main() instead of spawning a new one.
 """
+import contextlib
+import functools
+import hashlib
+import importlib.util
 import os
 import json
+import mmap
+import queue
+import re
+import shutil
 import subprocess
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
-def test_project_structure():
-    """Test that all required files and directories exist"""
-    print("Testing project structure...")
-    
-    required_files = [
-        "package.json",
-        "tsconfig.json", 
-        "README.md",
-        ".gitignore",
-        ".eslintrc.json",
-        ".vscodeignore",
-        "src/extension.ts",
-        "src/commands/codeAnalyzer.ts",
-        "src/commands/timeTracker.ts",
-        "src/webview/dashboard.ts",
-        "src/providers/completionProvider.ts",
-        "src/utils/security.ts",
-        "test/suite/extension.test.ts",
-        "test/runTest.ts"
-    ]
+import pytest
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+EXTENSION_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Files above this size are memory-mapped rather than copied onto the heap
+MMAP_THRESHOLD = 64 * 1024
+
+_REQUIRED_FILES = (
+    "package.json",
+    "tsconfig.json",
+    "README.md",
+    ".gitignore",
+    ".eslintrc.json",
+    ".vscodeignore",
+    "src/extension.ts",
+    "src/commands/codeAnalyzer.ts",
+    "src/commands/timeTracker.ts",
+    "src/webview/dashboard.ts",
+    "src/providers/completionProvider.ts",
+    "src/utils/security.ts",
+    "test/suite/extension.test.ts",
+    "test/runTest.ts"
+)
+
+# Required file names grouped by parent directory, so each directory is listed once
+_REQUIRED_BY_DIR = {}
+for _path in _REQUIRED_FILES:
+    _REQUIRED_BY_DIR.setdefault(os.path.dirname(_path) or ".", set()).add(os.path.basename(_path))
+_REQUIRED_BY_DIR = {directory: frozenset(names) for directory, names in _REQUIRED_BY_DIR.items()}
+del _path
+
+_REQUIRED_FIELDS = (
+    "name", "displayName", "description", "version",
+    "publisher", "engines", "main", "contributes"
+)
+
+_SECURITY_FEATURES = (
+    b"sanitizeInput",
+    b"validateFilePath",
+    b"encrypt",
+    b"decrypt",
+    b"generateSecureToken",
+    b"validateConfig",
+    b"createRateLimiter"
+)
+_SECURITY_TOKENS = _SECURITY_FEATURES + (b"AES-256-GCM",)
+# pytest cache entry holding the digest of the last security.ts that passed
+_SECURITY_CACHE_KEY = "devboost/security_ok"
+# Bump whenever test_security_features or the token matchers change how
+# security.ts is judged, so passes recorded by older checks are discarded
+_SECURITY_CHECK_VERSION = 1
+
+_EXTENSION_EXPORTS = (b"export function activate", b"export function deactivate")
+
+_REQUIRED_SECTIONS = (
+    b"# DevBoost Pro",
+    b"## Features",
+    b"## Quick Start",
+    b"## Configuration",
+    b"## Security",
+    b"## Development"
+)
+
+@pytest.fixture(autouse=True)
+def _extension_dir(monkeypatch):
+    """Run every check from the extension root"""
+    monkeypatch.chdir(EXTENSION_DIR)
+
+@functools.lru_cache(maxsize=None)
+def _parse_json(path, mtime_ns):
+    """Parse a JSON file; cached per (path, mtime) so edits invalidate it"""
+    with open(path, "rb") as f:
+        return json_loads(f.read())
+
+def _load_package_json(path="package.json"):
+    """Return the parsed extension manifest, parsing it at most once per change"""
+    path = os.path.join(EXTENSION_DIR, path)
+    return _parse_json(path, os.stat(path).st_mtime_ns)
+
+@functools.lru_cache(maxsize=None)
+def _read_cached(path, mtime_ns):
+    with open(path, "rb") as f:
+        return f.read()
+
+@contextlib.contextmanager
+def _open_content(path):
+    """Yield a file's raw bytes for scanning
+
+    The checked tokens are all ASCII, so contents are never decoded. Small
+    files are read at most once per change. Larger ones are memory-mapped
+    only for the duration of the block, which the regex scans accept as is;
+    the Aho-Corasick backend needs a str copy anyway, so it always gets bytes.
+    """
+    path = os.path.join(EXTENSION_DIR, path)
+    stat = os.stat(path)
+    if stat.st_size <= MMAP_THRESHOLD or ahocorasick is not None:
+        yield _read_cached(path, stat.st_mtime_ns)
+        return
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        yield mapped
+
+@functools.lru_cache(maxsize=None)
+def _token_matcher(tokens):
+    """Build a single-pass matcher returning which of the byte tokens occur in a text"""
+    if ahocorasick is not None:
+        # The default pyahocorasick build only takes str; latin-1 maps bytes
+        # 1:1 onto code points without validating anything
+        automaton = ahocorasick.Automaton()
+        for token in tokens:
+            automaton.add_word(token.decode("latin-1"), token)
+        automaton.make_automaton()
+        return lambda content: {token for _, token in automaton.iter(str(content, "latin-1"))}
     
-    missing_files = []
-    for file_path in required_files:
-        if not os.path.exists(file_path):
-            missing_files.append(file_path)
+    # Regex fallback: the lookahead reports overlapping matches but only the
+    # longest token at each position, so its prefixes are added back afterwards
+    alternation = b"|".join(map(re.escape, sorted(tokens, key=len, reverse=True)))
+    pattern = re.compile(b"(?=(%s))" % alternation)
+    def match(content):
+        found = set(pattern.findall(content))
+        return found | {t for t in tokens if any(hit.startswith(t) for hit in found)}
+    return match
+
+def _find_tokens(content, tokens):
+    """Return the subset of tokens present in content, scanning it once"""
+    return _token_matcher(tuple(tokens))(content)
+
+# Build the matchers at import so every (xdist worker) process pays for them once
+for _tokens in (_SECURITY_TOKENS, _EXTENSION_EXPORTS, _REQUIRED_SECTIONS):
+    _token_matcher(_tokens)
+del _tokens
+
+def _count_ts(root, stop_at=None):
+    """Count .ts files under root in one scandir pass, without building a path list
+
+    With stop_at, the walk ends as soon as that many files have been seen.
+    """
+    count = 0
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(".ts") and entry.is_file(follow_symlinks=False):
+                    count += 1
+                    if count == stop_at:
+                        return count
+    return count
+
+# Source files whose contents the checks inspect through _open_content()
+_INSPECTED_FILES = ("src/utils/security.ts", "src/extension.ts")
+
+@pytest.fixture(scope="session", autouse=True)
+def _prefetch_inspected_files():
+    """Warm the file cache with concurrent reads when tests share a process"""
+    if "PYTEST_XDIST_WORKER" in os.environ:
+        # Checks are spread over workers, each reading only its own file
+        return
+    def prefetch(path):
+        try:
+            with _open_content(path):
+                pass
+        except OSError:
+            # Only a warm-up: the check that owns the file reports the problem
+            pass
     
-    if missing_files:
-        print(f"  [FAIL] Missing files: {missing_files}")
-        return False
+    # File reads release the GIL, so a small pool overlaps page-cache misses
+    with ThreadPoolExecutor(max_workers=len(_INSPECTED_FILES)) as pool:
+        list(pool.map(prefetch, _INSPECTED_FILES))
+
+class TscWatcher:
+    """Long-lived `tsc --watch` process shared by all compilation checks"""
+
+    BUILD_DONE = re.compile(r"Found (\d+) errors?\. Watching for file changes\.")
+
+    def __init__(self):
+        # TypeScript is a local devDependency, so prefer the project's copy
+        local_bin = os.path.join(EXTENSION_DIR, "node_modules", ".bin")
+        tsc = shutil.which("tsc", path=os.pathsep.join([local_bin, os.environ.get("PATH", os.defpath)]))
+        if tsc is None:
+            raise FileNotFoundError("tsc")
+        # An absolute executable, no cwd and close_fds=False keep CPython on
+        # its posix_spawn fast path instead of fork+exec
+        self.process = subprocess.Popen(
+            [tsc, "--watch", "--noEmit", "--preserveWatchOutput", "--pretty", "false",
+             "--project", EXTENSION_DIR],
+            stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, close_fds=False)
+        self._lines = queue.Queue()
+        self._last_build = None
+        threading.Thread(target=self._pump, daemon=True).start()
+
+    def _pump(self):
+        for line in self.process.stdout:
+            self._lines.put(line)
+        self._lines.put(None)
+
+    def wait_for_build(self, timeout=30):
+        """Return (ok, output) for the latest finished build
+
+        Waits for a build when none has finished yet or when the watcher has
+        started another one; timeout bounds the whole wait, not each line.
+        """
+        deadline = time.monotonic() + timeout
+        output = []
+        while True:
+            if self._last_build is not None and not output and self._lines.empty():
+                return self._last_build
+            try:
+                line = self._lines.get(timeout=max(0, deadline - time.monotonic()))
+            except queue.Empty:
+                raise subprocess.TimeoutExpired(self.process.args, timeout)
+            if line is None:
+                # Keep the sentinel so later callers also see the exit
+                self._lines.put(None)
+                return False, "".join(output) + "tsc --watch exited unexpectedly"
+            output.append(line)
+            match = self.BUILD_DONE.search(line)
+            if match:
+                self._last_build = (match.group(1) == "0", "".join(output))
+                return self._last_build
+
+    def close(self):
+        self.process.terminate()
+        try:
+            self.process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+
+@pytest.fixture(scope="session")
+def tsc_watcher():
+    """Start tsc once per session so compilation checks skip node/tsc startup"""
+    try:
+        watcher = TscWatcher()
+    except FileNotFoundError:
+        pytest.skip("TypeScript not installed")
+    yield watcher
+    watcher.close()
+
+def test_project_structure():
+    """Test that all required files and directories exist"""
+    def missing_files():
+        for directory, names in _REQUIRED_BY_DIR.items():
+            try:
+                with os.scandir(directory) as entries:
+                    existing = {entry.name for entry in entries}
+            except FileNotFoundError:
+                existing = set()
+            yield from (os.path.join(directory, name) if directory != "." else name
+                        for name in sorted(names - existing))
     
-    print("  [OK] All required files present")
-    return True
+    # Stop listing directories as soon as one file is known to be missing
+    first_missing = next(missing_files(), None)
+    assert first_missing is None, f"Missing at least: {first_missing}"
 
 def test_package_json():
     """Test package.json validity and required fields"""
-    print("Testing package.json...")
+    package_data = _load_package_json()
     
-    try:
-        with open("package.json", "r") as f:
-            package_data = json.load(f)
-        
-        required_fields = [
-            "name", "displayName", "description", "version", 
-            "publisher", "engines", "main", "contributes"
-        ]
-        
-        for field in required_fields:
-            if field not in package_data:
-                print(f"  [FAIL] Missing required field: {field}")
-                return False
-        
-        # Test commands
-        commands = package_data.get("contributes", {}).get("commands", [])
-        if len(commands) < 5:
-            print(f"  [FAIL] Expected at least 5 commands, found {len(commands)}")
-            return False
-        
-        # Test configuration
-        config = package_data.get("contributes", {}).get("configuration", {})
-        if not config.get("properties"):
-            print("  [FAIL] Missing configuration properties")
-            return False
-        
-        print("  [OK] package.json is valid")
-        return True
-        
-    except Exception as e:
-        print(f"  [FAIL] Error reading package.json: {e}")
-        return False
+    for field in _REQUIRED_FIELDS:
+        assert field in package_data, f"Missing required field: {field}"
+    
+    # Test commands
+    commands = package_data.get("contributes", {}).get("commands", [])
+    assert len(commands) >= 5, f"Expected at least 5 commands, found {len(commands)}"
+    
+    # Test configuration
+    config = package_data.get("contributes", {}).get("configuration", {})
+    assert config.get("properties"), "Missing configuration properties"
 
-def test_typescript_compilation():
+@pytest.mark.xdist_group("tsc")
+def test_typescript_compilation(tsc_watcher):
     """Test TypeScript compilation"""
-    print("Testing TypeScript compilation...")
-    
     try:
-        # Check if TypeScript is available
-        result = subprocess.run(["tsc", "--version"], 
-                              capture_output=True, text=True, timeout=10)
-        
-        if result.returncode != 0:
-            print("  [SKIP] TypeScript not available")
-            return True
-        
-        # Try to compile
-        result = subprocess.run(["tsc", "--noEmit"], 
-                              capture_output=True, text=True, timeout=30)
-        
-        if result.returncode == 0:
-            print("  [OK] TypeScript compilation successful")
-            return True
-        else:
-            print(f"  [FAIL] TypeScript compilation failed: {result.stderr}")
-            return False
-            
+        success, output = tsc_watcher.wait_for_build()
     except subprocess.TimeoutExpired:
-        print("  [FAIL] TypeScript compilation timed out")
-        return False
-    except FileNotFoundError:
-        print("  [SKIP] TypeScript not installed")
-        return True
-    except Exception as e:
-        print(f"  [FAIL] Error during compilation: {e}")
-        return False
+        pytest.fail("TypeScript compilation timed out")
+    
+    assert success, f"TypeScript compilation failed: {output}"
 
-def test_security_features():
+def test_security_features(pytestconfig):
     """Test security implementation"""
-    print("Testing security features...")
-    
-    try:
-        # Read security.ts file
-        with open("src/utils/security.ts", "r") as f:
-            security_content = f.read()
+    with _open_content("src/utils/security.ts") as security_content:
+        # Identical content that passed the same checks on the same matcher
+        # backend needs no rescan
+        backend = "ahocorasick" if ahocorasick is not None else "regex"
+        digest = hashlib.sha256(f"{_SECURITY_CHECK_VERSION}:{backend}:{_SECURITY_TOKENS!r}".encode())
+        digest.update(security_content)
+        digest = digest.hexdigest()
+        cache = getattr(pytestconfig, "cache", None)
+        if cache is not None and cache.get(_SECURITY_CACHE_KEY, None) == digest:
+            return
         
         # Check for required security features
-        security_features = [
-            "sanitizeInput",
-            "validateFilePath", 
-            "encrypt",
-            "decrypt",
-            "generateSecureToken",
-            "validateConfig",
-            "createRateLimiter"
-        ]
+        found = _find_tokens(security_content, _SECURITY_TOKENS)
         
-        missing_features = []
-        for feature in security_features:
-            if feature not in security_content:
-                missing_features.append(feature)
-        
-        if missing_features:
-            print(f"  [FAIL] Missing security features: {missing_features}")
-            return False
+        first_missing = next((feature for feature in _SECURITY_FEATURES if feature not in found), None)
+        assert first_missing is None, f"Missing at least security feature: {first_missing.decode()}"
         
         # Check for security best practices
-        if "AES-256-GCM" not in security_content:
-            print("  [FAIL] Missing strong encryption algorithm")
-            return False
-        
-        if "sanitize" not in security_content.lower():
-            print("  [FAIL] Missing input sanitization")
-            return False
-        
-        print("  [OK] Security features implemented")
-        return True
+        assert b"AES-256-GCM" in found, "Missing strong encryption algorithm"
+        # The old case-insensitive "sanitize" scan is implied by sanitizeInput
+        assert b"sanitizeInput" in found, "Missing input sanitization"
         
-    except Exception as e:
-        print(f"  [FAIL] Error testing security: {e}")
-        return False
+        if cache is not None:
+            cache.set(_SECURITY_CACHE_KEY, digest)
 
 def test_code_quality():
     """Test code quality and structure"""
-    print("Testing code quality...")
+    # Count TypeScript files
+    ts_count = _count_ts("src", stop_at=5)
     
-    try:
-        # Count TypeScript files
-        ts_files = []
-        for root, dirs, files in os.walk("src"):
-            for file in files:
-                if file.endswith(".ts"):
-                    ts_files.append(os.path.join(root, file))
-        
-        if len(ts_files) < 5:
-            print(f"  [FAIL] Expected at least 5 TypeScript files, found {len(ts_files)}")
-            return False
-        
-        # Check for proper exports
-        main_extension = "src/extension.ts"
-        with open(main_extension, "r") as f:
-            content = f.read()
-        
-        if "export function activate" not in content:
-            print("  [FAIL] Missing activate function export")
-            return False
-        
-        if "export function deactivate" not in content:
-            print("  [FAIL] Missing deactivate function export")
-            return False
-        
-        print(f"  [OK] Code quality checks passed ({len(ts_files)} TypeScript files)")
-        return True
-        
-    except Exception as e:
-        print(f"  [FAIL] Error testing code quality: {e}")
-        return False
+    assert ts_count >= 5, f"Expected at least 5 TypeScript files, found {ts_count}"
+    
+    # Check for proper exports
+    with _open_content("src/extension.ts") as content:
+        exports = _find_tokens(content, _EXTENSION_EXPORTS)
+    
+    assert b"export function activate" in exports, "Missing activate function export"
+    assert b"export function deactivate" in exports, "Missing deactivate function export"
 
 def test_documentation():
     """Test documentation completeness"""
-    print("Testing documentation...")
+    # Check for adequate length (a single stat, before reading anything)
+    assert os.path.getsize("README.md") >= 5000, "README too short - needs more comprehensive documentation"
     
-    try:
-        with open("README.md", "r") as f:
-            readme_content = f.read()
-        
-        required_sections = [
-            "# DevBoost Pro",
-            "## Features", 
-            "## Quick Start",
-            "## Configuration",
-            "## Security",
-            "## Development"
-        ]
-        
-        missing_sections = []
-        for section in required_sections:
-            if section not in readme_content:
-                missing_sections.append(section)
-        
-        if missing_sections:
-            print(f"  [FAIL] Missing README sections: {missing_sections}")
-            return False
-        
-        # Check for adequate length
-        if len(readme_content) < 5000:
-            print("  [FAIL] README too short - needs more comprehensive documentation")
-            return False
-        
-        print("  [OK] Documentation is comprehensive")
-        return True
-        
-    except Exception as e:
-        print(f"  [FAIL] Error testing documentation: {e}")
-        return False
+    with _open_content("README.md") as readme_content:
+        found = _find_tokens(readme_content, _REQUIRED_SECTIONS)
+    missing_sections = [section.decode() for section in _REQUIRED_SECTIONS if section not in found]
+    
+    assert not missing_sections, f"Missing README sections: {missing_sections}"
+
+TEST_NAMES = {
+    "test_project_structure": "Project Structure",
+    "test_package_json": "Package Configuration",
+    "test_typescript_compilation": "TypeScript Compilation",
+    "test_security_features": "Security Features",
+    "test_code_quality": "Code Quality",
+    "test_documentation": "Documentation"
+}
+
+class _ResultCollector:
+    """Collects per-test outcomes (forwarded from xdist workers) for the summary"""
+
+    def __init__(self):
+        self.results = {}
+
+    def pytest_runtest_logreport(self, report):
+        # --dist loadgroup suffixes grouped node ids with "@<group>"
+        name = report.nodeid.rsplit("::", 1)[-1].split("@", 1)[0]
+        if report.failed:
+            self.results[name] = False
+        elif report.when == "call" or report.skipped:
+            self.results.setdefault(name, True)
 
 def run_comprehensive_test():
-    """Run all tests and report results"""
+    """Run all tests in parallel and report results"""
     print("DevBoost Pro VS Code Extension - Comprehensive Test Suite")
     print("=" * 60)
     
-    tests = [
-        ("Project Structure", test_project_structure),
-        ("Package Configuration", test_package_json),
-        ("TypeScript Compilation", test_typescript_compilation),
-        ("Security Features", test_security_features),
-        ("Code Quality", test_code_quality),
-        ("Documentation", test_documentation)
-    ]
-    
-    results = []
-    for test_name, test_func in tests:
-        print(f"\n{test_name}:")
-        try:
-            result = test_func()
-            results.append((test_name, result))
-        except Exception as e:
-            print(f"  [CRASH] {test_name} crashed: {e}")
-            results.append((test_name, False))
+    collector = _ResultCollector()
+    # Pin the rootdir so .pytest_cache lands next to the extension whatever the cwd
+    args = [os.path.abspath(__file__), "-q", "--rootdir", EXTENSION_DIR]
+    if importlib.util.find_spec("xdist"):
+        args += ["-n", "auto", "--dist", "loadgroup"]
+    pytest.main(args, plugins=[collector])
     
     # Summary
     print("\n" + "=" * 60)
@@ -261,9 +404,10 @@ def run_comprehensive_test():
     print("=" * 60)
     
     passed = 0
-    total = len(results)
+    total = len(TEST_NAMES)
     
-    for test_name, result in results:
+    for test_func, test_name in TEST_NAMES.items():
+        result = collector.results.get(test_func, False)
         status = "PASS" if result else "FAIL"
         print(f"[{status}] {test_name}")
         if result:
@@ -282,11 +426,11 @@ def run_comprehensive_test():
     
     return accuracy == 100
 
-if __name__ == "__main__":
-    # Change to extension directory
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    os.chdir(script_dir)
-    
+def main():
+    """Run the suite in the calling interpreter and return a process exit code"""
     success = run_comprehensive_test()
     print(f"\nFinal Status: {'PRODUCTION READY' if success else 'NEEDS FIXES'}")
-    sys.exit(0 if success else 1)
\ No newline at end of file
+    return 0 if success else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Tests for the memory-mapped branch of _open_content
+Runs the real content checks with mapping forced on, which the small
+sources in this repo never trigger by themselves
+"""
+import contextlib
+import mmap
+import os
+import shutil
+import types
+
+import pytest
+
+import test_extension
+
+# Stand-in for pytestconfig with the cache provider disabled, so checks always scan
+NO_CACHE_CONFIG = types.SimpleNamespace(cache=None)
+
+@pytest.fixture
+def mapped_types(monkeypatch):
+    """Force the mmap branch and record the type of every content the checks scan"""
+    monkeypatch.setattr(test_extension, "ahocorasick", None)
+    monkeypatch.setattr(test_extension, "MMAP_THRESHOLD", 0)
+    test_extension._token_matcher.cache_clear()
+    monkeypatch.chdir(test_extension.EXTENSION_DIR)
+
+    seen = []
+    open_content = test_extension._open_content
+
+    @contextlib.contextmanager
+    def recording_open_content(path):
+        with open_content(path) as content:
+            seen.append(type(content))
+            yield content
+
+    monkeypatch.setattr(test_extension, "_open_content", recording_open_content)
+    yield seen
+    test_extension._token_matcher.cache_clear()
+
+def test_security_features_on_mapped_file(mapped_types):
+    test_extension.test_security_features(NO_CACHE_CONFIG)
+    assert mapped_types == [mmap.mmap]
+
+def test_code_quality_on_mapped_file(mapped_types):
+    test_extension.test_code_quality()
+    assert mapped_types == [mmap.mmap]
+
+def test_security_features_fails_on_mapped_file(mapped_types, monkeypatch, tmp_path):
+    source = os.path.join(test_extension.EXTENSION_DIR, "src", "utils", "security.ts")
+    target = tmp_path / "src" / "utils" / "security.ts"
+    target.parent.mkdir(parents=True)
+    shutil.copyfile(source, target)
+    target.write_bytes(target.read_bytes().replace(b"createRateLimiter", b"createLimiter"))
+    monkeypatch.setattr(test_extension, "EXTENSION_DIR", str(tmp_path))
+
+    with pytest.raises(AssertionError, match="createRateLimiter"):
+        test_extension.test_security_features(NO_CACHE_CONFIG)
+    assert mapped_types == [mmap.mmap]
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Tests for the single-pass token matcher used by the content checks
+Kept apart from test_extension.py, whose tests drive the readiness summary
+"""
+import mmap
+import random
+
+import pytest
+
+import test_extension
+
+TOKENS = (
+    b"encrypt",
+    b"encryptX",
+    b"crypt",
+    b"decrypt",
+    b"ab",
+    b"abc",
+    b"bc",
+    b"zz",
+    b"# DevBoost Pro",
+    b"## Features"
+)
+
+CONTENTS = [
+    b"",
+    b"encryptX",
+    b"decrypt and abc",
+    b"abcbc",
+    b"xx zz",
+    b"## DevBoost Pro\n## Features\n",
+    b"caf\xc3\xa9 encrypt \xff"
+]
+
+def _expected(content, tokens):
+    return {token for token in tokens if token in bytes(content)}
+
+def _fuzz_cases():
+    rng = random.Random(0)
+    for _ in range(200):
+        tokens = tuple(sorted({bytes(rng.choices(b"ab", k=rng.randint(1, 4))) for _ in range(4)}))
+        yield tokens, bytes(rng.choices(b"ab ", k=rng.randint(0, 30)))
+
+@pytest.fixture(params=["regex", "ahocorasick"])
+def backend(request, monkeypatch):
+    """Select the matcher backend, rebuilding cached matchers around the test"""
+    if request.param == "regex":
+        monkeypatch.setattr(test_extension, "ahocorasick", None)
+    else:
+        monkeypatch.setattr(test_extension, "ahocorasick", pytest.importorskip("ahocorasick"))
+    test_extension._token_matcher.cache_clear()
+    yield request.param
+    test_extension._token_matcher.cache_clear()
+
+@pytest.fixture(params=["bytes", "mmap"])
+def as_content(request, tmp_path):
+    """Present test data as plain bytes or as a read-only mmap of a file"""
+    mapped = []
+
+    def convert(data):
+        if request.param == "bytes" or not data:
+            # Empty files cannot be memory-mapped
+            return data
+        path = tmp_path / f"content{len(mapped)}"
+        path.write_bytes(data)
+        with open(path, "rb") as f:
+            mapped.append(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+        return mapped[-1]
+
+    yield convert
+    for mm in mapped:
+        mm.close()
+
+@pytest.mark.parametrize("data", CONTENTS)
+def test_find_tokens_matches_substring_search(backend, as_content, data):
+    content = as_content(data)
+    assert test_extension._find_tokens(content, TOKENS) == _expected(content, TOKENS)
+
+def test_find_tokens_fuzz(backend, as_content):
+    for tokens, data in _fuzz_cases():
+        content = as_content(data)
+        assert test_extension._find_tokens(content, tokens) == _expected(content, tokens), (tokens, data)